@@ -38,6 +38,7 @@ CREATE TABLE vehicle.merchants (
 -- Columns:
 --  txn_id: synthetic primary key (e.g., T000001)
 --  vehicle_id/merchant_id/txn_ts/amount: descriptive attributes with validation
+--  log_amount: ln(1 + amount), computed once on write (generated column)
 CREATE TABLE vehicle.transactions (
     txn_id VARCHAR(7) PRIMARY KEY,
     vehicle_id VARCHAR(5) NOT NULL
@@ -51,10 +52,31 @@ CREATE TABLE vehicle.transactions (
     longitude DOUBLE PRECISION NOT NULL,
     channel TEXT NOT NULL
         CHECK (channel IN ('card_present', 'in_app', 'web')),
-    is_fraud BOOLEAN NOT NULL DEFAULT FALSE
+    is_fraud BOOLEAN NOT NULL DEFAULT FALSE,
+    log_amount DOUBLE PRECISION
+        GENERATED ALWAYS AS (LN(amount + 1.0)::double precision) STORED
+);
+
+-- Transaction scores:
+-- Model probabilities written in batch by src/score.py, so the dashboard
+-- reads scores instead of running the model per request.
+-- Columns:
+--  txn_id: scored transaction (1:1 with vehicle.transactions)
+--  proba: predicted fraud probability in [0, 1]
+--  scored_at: when the batch was written
+CREATE TABLE vehicle.transaction_scores (
+    txn_id VARCHAR(7) PRIMARY KEY
+        REFERENCES vehicle.transactions(txn_id),
+    proba DOUBLE PRECISION NOT NULL
+        CHECK (proba BETWEEN 0 AND 1),
+    scored_at TIMESTAMP NOT NULL DEFAULT now()
 );
 
 -- Helpful index for common queries:
 -- e.g., retrieving transactions for a specific vehicle in time order.
 CREATE INDEX IF NOT EXISTS idx_transactions_vehicle_ts
-    ON vehicle.transactions (vehicle_id, txn_ts);
\ No newline at end of file
+    ON vehicle.transactions (vehicle_id, txn_ts);
+
+-- e.g., listing distinct channels for dashboard filters.
+CREATE INDEX IF NOT EXISTS idx_transactions_channel
+    ON vehicle.transactions (channel);
\ No newline at end of file
@@ -17,10 +17,13 @@ SELECT
     -- handy engineered features (stable names)
     EXTRACT(HOUR FROM t.txn_ts)::int AS hour,
     EXTRACT(DOW  FROM t.txn_ts)::int AS dow,
-    LN(t.amount + 1.0)                AS log_amount,
+    t.log_amount,                     -- stored generated column
     SQRT(POWER(t.latitude  - m.latitude , 2)
        + POWER(t.longitude - m.longitude, 2)) AS geo_delta,
     -- label
-    t.is_fraud
+    t.is_fraud,
+    -- precomputed model score (NULL until src/score.py has run)
+    s.proba
 FROM vehicle.transactions t
-JOIN vehicle.merchants m USING (merchant_id);
+JOIN vehicle.merchants m USING (merchant_id)
+LEFT JOIN vehicle.transaction_scores s USING (txn_id);
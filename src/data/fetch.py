@@ -4,9 +4,11 @@ Fetch Connected Vehicle data from Postgres database.
 # -- Imports --
 from dotenv import load_dotenv
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+import connectorx as cx
 import pandas as pd
+import pyarrow as pa
 
 # -- Function Definitions --
 
@@ -28,10 +30,40 @@ def get_engine() -> Engine:
     return create_engine(url)
 
 
-_SQL = text("""
+CATEGORICAL_COLS = ("category", "channel")
+
+_SQL = """
     SELECT *
     FROM vehicle.v_txn_for_dashboard
-""")
+"""
+
+
+def arrow_to_pandas(table: pa.Table,
+                    categorical_cols: tuple[str, ...] = CATEGORICAL_COLS) -> pd.DataFrame:
+    """
+    Convert a ConnectorX Arrow result into the DataFrame layout used across the project.
+
+    Args:
+        table (pa.Table): Query result read with `return_type="arrow"`.
+        categorical_cols (tuple[str, ...], optional): Columns to turn into pandas
+            categoricals; those missing from the table are skipped.
+
+    Returns:
+        pd.DataFrame: Arrow-backed (pd.ArrowDtype) columns, with NUMERIC cast to
+            float64 and `categorical_cols` as pandas categoricals.
+    """
+    # NUMERIC columns arrive as decimal128; models and the app expect floats
+    table = table.cast(pa.schema([
+        pa.field(f.name, pa.float64()) if pa.types.is_decimal(f.type) else f
+        for f in table.schema
+    ]))
+    # Low-cardinality text becomes pandas categoricals (integer codes)
+    for name in categorical_cols:
+        if name in table.column_names:
+            i = table.column_names.index(name)
+            table = table.set_column(i, name, table[name].dictionary_encode())
+    return table.to_pandas(types_mapper=lambda t: None if pa.types.is_dictionary(t)
+                           else pd.ArrowDtype(t))
 
 
 def load_training_frame(engine: Engine = None) -> pd.DataFrame:
@@ -46,6 +78,9 @@ def load_training_frame(engine: Engine = None) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame with joined transaction + merchant data, 
         including engineered columns (hour, day of week, geo coords).
+        Columns are Arrow-backed (pd.ArrowDtype); category/channel are pandas categoricals.
     """
     eng = engine or get_engine()
-    return pd.read_sql(_SQL, eng)
+    # ConnectorX talks to Postgres directly; drop the SQLAlchemy driver suffix
+    url = eng.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    return arrow_to_pandas(cx.read_sql(url, _SQL, return_type="arrow"))
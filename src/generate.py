@@ -19,10 +19,8 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
-import random
 
-np.random.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)  # PCG64; all draws come from this generator
 
 RAW = Path("data/raw")
 RAW.mkdir(parents=True, exist_ok=True)
@@ -38,71 +36,70 @@ years = list(range(2005,2025))
 categories = ['Fuel','Parking','Maintenance','Tolls','CarWash','Food','Groceries']
 channels = ['in_app','card_present','web']
 
-def rand_coord():
-    """Random (lat, lon) in a Bay-Area-ish bounding box."""
-    lat = np.random.uniform(37.3, 38.2)
-    lon = np.random.uniform(-122.55, -121.7)
-    return float(lat), float(lon)
+def rand_coords(n):
+    """n random (lat, lon) arrays in a Bay-Area-ish bounding box."""
+    lat = rng.uniform(37.3, 38.2, n)
+    lon = rng.uniform(-122.55, -121.7, n)
+    return lat, lon
 
 # Vehicles
 vehicles = pd.DataFrame({
     'vehicle_id': [f'V{idx:04d}' for idx in range(N_VEH)],
-    'make': np.random.choice(makes, N_VEH),
-    'model': np.random.choice(models, N_VEH),
-    'year': np.random.choice(years, N_VEH)
+    'make': rng.choice(makes, N_VEH),
+    'model': rng.choice(models, N_VEH),
+    'year': rng.choice(years, N_VEH)
 })
 
 # Merchants
-coords = [rand_coord() for _ in range(N_MERCH)]
+m_lat, m_lon = rand_coords(N_MERCH)
 merchants = pd.DataFrame({
     'merchant_id': [f'M{idx:04d}' for idx in range(N_MERCH)],
     'name': [f'Merchant_{idx:04d}' for idx in range(N_MERCH)],
-    'category': np.random.choice(categories, N_MERCH, p=[0.35,0.15,0.10,0.10,0.05,0.15,0.10]),
-    'latitude': [c[0] for c in coords],
-    'longitude': [c[1] for c in coords],
+    'category': rng.choice(categories, N_MERCH, p=[0.35,0.15,0.10,0.10,0.05,0.15,0.10]),
+    'latitude': m_lat,
+    'longitude': m_lon,
 })
 
-# Transactions
+# Transactions (vectorized: every column is drawn for all N_TXN rows at once)
+AMT_BASE = {'Fuel':55,'Parking':18,'Maintenance':250,'Tolls':6,'CarWash':14,'Food':22,'Groceries':80}
+
+vid_idx = rng.integers(0, N_VEH, N_TXN)
+mid_idx = rng.integers(0, N_MERCH, N_TXN)
+cat = merchants['category'].to_numpy()[mid_idx]
+
+# time moves forward with exponential gaps (whole minutes)
 start = datetime.now() - timedelta(days=60)
-rows = []
-for i in range(N_TXN):
-    vrow = vehicles.sample(1).iloc[0]
-    mrow = merchants.sample(1).iloc[0]
-
-    vid = vrow['vehicle_id']
-    mid = mrow['merchant_id']
-    cat = mrow['category']
-
-    # time moves forward with exponential gaps
-    start = start + timedelta(minutes=int(np.random.exponential(45)))
-    ts = start
-
-    # category-dependent amount baseline
-    amt_base = {'Fuel':55,'Parking':18,'Maintenance':250,'Tolls':6,'CarWash':14,'Food':22,'Groceries':80}[cat]
-    amount = max(1, np.random.normal(amt_base, amt_base*0.35))
-
-    # jitter near merchant
-    lat = float(mrow['latitude'] + np.random.normal(0, 0.01))
-    lon = float(mrow['longitude'] + np.random.normal(0, 0.01))
-
-    channel = np.random.choice(channels, p=[0.5,0.3,0.2])
-
-    # simple fraud rules
-    is_fraud = False
-    if amount > amt_base * 3.0:
-        is_fraud = True
-    if np.random.rand() < 0.03:        # distance anomaly
-        lat += np.random.uniform(1.0, 2.0)
-        lon += np.random.uniform(1.0, 2.0)
-        is_fraud = True
-    if channel == 'web' and cat in ['Fuel','CarWash'] and np.random.rand() < 0.3:
-        is_fraud = True
-
-    rows.append((f'T{i:06d}', vid, mid, ts, round(float(amount),2), lat, lon, channel, is_fraud))
-
-transactions = pd.DataFrame(rows, columns=[
-    'txn_id','vehicle_id','merchant_id','txn_ts','amount','latitude','longitude','channel','is_fraud'
-])
+gaps = rng.exponential(45, N_TXN).astype('timedelta64[m]')
+ts = np.datetime64(start) + np.cumsum(gaps)
+
+# category-dependent amount baseline
+amt_base = merchants['category'].map(AMT_BASE).to_numpy(dtype=float)[mid_idx]
+amount = np.maximum(1, rng.normal(amt_base, amt_base*0.35))
+
+# jitter near merchant
+lat = merchants['latitude'].to_numpy()[mid_idx] + rng.normal(0, 0.01, N_TXN)
+lon = merchants['longitude'].to_numpy()[mid_idx] + rng.normal(0, 0.01, N_TXN)
+
+channel = rng.choice(channels, N_TXN, p=[0.5,0.3,0.2])
+
+# simple fraud rules (boolean masks)
+dist_anomaly = rng.random(N_TXN) < 0.03
+lat[dist_anomaly] += rng.uniform(1.0, 2.0, dist_anomaly.sum())
+lon[dist_anomaly] += rng.uniform(1.0, 2.0, dist_anomaly.sum())
+web_fuelwash = (channel == 'web') & np.isin(cat, ['Fuel','CarWash']) & (rng.random(N_TXN) < 0.3)
+is_fraud = (amount > amt_base * 3.0) | dist_anomaly | web_fuelwash
+
+transactions = pd.DataFrame({
+    'txn_id': [f'T{i:06d}' for i in range(N_TXN)],
+    'vehicle_id': vehicles['vehicle_id'].to_numpy()[vid_idx],
+    'merchant_id': merchants['merchant_id'].to_numpy()[mid_idx],
+    'txn_ts': ts,
+    'amount': amount.round(2),
+    'latitude': lat,
+    'longitude': lon,
+    'channel': channel,
+    'is_fraud': is_fraud,
+})
 
 vehicles.to_csv(RAW/'vehicles.csv', index=False)
 merchants.to_csv(RAW/'merchants.csv', index=False)
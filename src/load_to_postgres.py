@@ -10,11 +10,51 @@ Prereqs:
 """
 
 #  -- Imports --
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import os
 from sqlalchemy import create_engine, text
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import datetime
+import io
+
+
+#  -- Helpers --
+def copy_to_pg(df: pd.DataFrame, table: str, conn, schema: str = "vehicle") -> None:
+    """
+    Bulk load a DataFrame with Postgres `COPY ... FROM STDIN`.
+
+    One streamed CSV payload replaces the per-row INSERTs of `to_sql`.
+
+    Args:
+        df (pd.DataFrame): Rows to load; column names must match the table.
+        table (str): Target table name.
+        conn (sqlalchemy.engine.Connection): Open connection (psycopg2 driver);
+            the caller owns the transaction.
+        schema (str): Target schema.
+    """
+    buf = io.StringIO()
+    df.to_csv(buf, index=False, header=False)
+    buf.seek(0)
+    cols = ", ".join(df.columns)
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(
+            f"COPY {schema}.{table} ({cols}) FROM STDIN WITH (FORMAT CSV)", buf)
+
+
+def load_table(df: pd.DataFrame, table: str) -> None:
+    """
+    COPY a DataFrame into `vehicle.<table>` on its own pooled connection and transaction.
+
+    Args:
+        df (pd.DataFrame): Rows to load.
+        table (str): Target table name.
+    """
+    with engine.begin() as conn:
+        copy_to_pg(df, table, conn)
+
 
 #  -- Connect to Database --
 #  Get Database URL from .env
@@ -45,9 +85,17 @@ with engine.begin() as conn:
 
 
 #  -- Load CSVs --
-merchants = pd.read_csv("data/raw/merchants.csv")
-transactions = pd.read_csv("data/raw/transactions.csv")
-vehicles = pd.read_csv("data/raw/vehicles.csv")
+#  Multi-threaded Arrow parser; column types are fixed at parse time
+merchants = pacsv.read_csv("data/raw/merchants.csv").to_pandas()
+transactions = pacsv.read_csv(
+    "data/raw/transactions.csv",
+    convert_options=pacsv.ConvertOptions(column_types={
+        "txn_ts": pa.timestamp("us"),
+        "amount": pa.float64(),
+        "is_fraud": pa.bool_(),
+    }),
+).to_pandas()
+vehicles = pacsv.read_csv("data/raw/vehicles.csv").to_pandas()
 
 #  Check Content
 print(merchants.head(3))
@@ -56,26 +104,19 @@ print(vehicles.head(3))
 
 # -- Transform Data --
 vehicles.rename(columns={"year": "model_year"}, inplace=True)  # match schema
-vehicles["model_year"] = pd.to_numeric(vehicles["model_year"])  # enforce NOT NULL boolean
 
 merchants.rename(columns={"name": "merchant_name"}, inplace=True)
 
-transactions["txn_ts"] = pd.to_datetime(transactions["txn_ts"])
-transactions["amount"] = pd.to_numeric(transactions["amount"])
-transactions["is_fraud"] = transactions["is_fraud"].fillna(False).astype(bool)
-
 print(merchants.dtypes)
 print(vehicles.dtypes)
 print(transactions.dtypes)
 
 # -- Add Data to Postgres --
-with engine.begin() as conn:
-    vehicles.to_sql("vehicles", conn, schema="vehicle",
-                    if_exists="append", index=False)
-    merchants.to_sql("merchants", conn, schema="vehicle",
-                     if_exists="append", index=False)
-    transactions.to_sql("transactions", conn, schema="vehicle",
-                        if_exists="append", index=False)
+# Parent tables are independent: load them concurrently on separate connections.
+# Transactions reference both, so they load once the parents have committed.
+with ThreadPoolExecutor(max_workers=2) as pool:
+    list(pool.map(load_table, [vehicles, merchants], ["vehicles", "merchants"]))
+load_table(transactions, "transactions")
 
 # -- Testing --
 tests = [
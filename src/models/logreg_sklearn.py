@@ -20,17 +20,27 @@ class Model:
     """
     name = "logreg"
 
-    def __init__(self, random_state: int = 123):
+    def __init__(self, random_state: int = 123, solver: str = "lbfgs",
+                 tol: float = 1e-4, n_jobs: int | None = None):
         """
         Initialize model.
 
         Args:
             random_state (int, optional): Seed for reproducibility.
+            solver (str, optional): sklearn solver; "saga" is usually faster
+                on large or sparse (one-hot CSR) inputs.
+            tol (float, optional): Stopping tolerance.
+            n_jobs (int, optional): Passed through to sklearn, which only uses it
+                for multiclass one-vs-rest fits; it has no effect on this binary
+                fraud target, so the default leaves it unset.
         """
         self.clf = LogisticRegression(
             max_iter=1000,
             class_weight="balanced",
-            random_state=random_state
+            random_state=random_state,
+            solver=solver,
+            tol=tol,
+            n_jobs=n_jobs,
         )
 
     def fit(self, X, y):
@@ -3,6 +3,7 @@ Preprocessing utilities for machine learning models.
 
 Defines a function to create a scikit-learn ColumnTransformer
 that standardizes numeric features and one-hot encodes categorical features.
+The output is CSR when the one-hot block makes the matrix mostly zeros.
 """
 
 
@@ -10,22 +11,28 @@ from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.compose import ColumnTransformer
 
 
-def make_preprocessor(num_cols, cat_cols):
+def make_preprocessor(num_cols, cat_cols, sparse_threshold=0.3):
     """
     Build a preprocessing pipeline for numeric and categorical columns.
 
     Args:
         num_cols (list of str): Names of numeric feature columns.
         cat_cols (list of str): Names of categorical feature columns.
+        sparse_threshold (float): Overall density below which the stacked
+            output is kept as a CSR matrix (0 always densifies).
 
     Returns:
         sklearn.compose.ColumnTransformer: Transformer that applies:
-            - StandardScaler() to numeric columns
-            - OneHotEncoder(handle_unknown="ignore", sparse_output=False) to categorical columns
+            - StandardScaler(copy=False) to numeric columns (scales the
+              column block it is handed in place)
+            - OneHotEncoder(handle_unknown="ignore", sparse_output=True) to categorical columns
     """
     return ColumnTransformer(
         transformers=[
-            ("num", StandardScaler(), num_cols),
-            ("cat", OneHotEncoder(handle_unknown="ignore", sparse_output=False), cat_cols)
-        ]
+            # The ColumnTransformer already hands over its own copy of the
+            # selected columns, so scale that in place instead of copying again
+            ("num", StandardScaler(copy=False), num_cols),
+            ("cat", OneHotEncoder(handle_unknown="ignore", sparse_output=True), cat_cols)
+        ],
+        sparse_threshold=sparse_threshold,
     )
@@ -0,0 +1,127 @@
+"""
+Score transactions with a saved pipeline and persist the probabilities.
+
+Runs the model once over every transaction in the dashboard view and
+replaces the contents of `vehicle.transaction_scores`. The dashboard reads
+these precomputed scores, so re-run this after training a new model.
+
+Usage:
+    python -m src.score --model models/logreg.pkl
+
+Args:
+    --model (str): Path to a joblib-saved inference pipeline (default: models/logreg.pkl).
+"""
+# -- Imports --
+import argparse
+import io
+from typing import Callable
+import joblib
+import numpy as np
+import pandas as pd
+from scipy.special import expit
+from sklearn.linear_model import LogisticRegression
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from src.data.fetch import get_engine, load_training_frame
+from src.features.build import NUM_COLS, CAT_COLS
+
+
+# -- Function Definitions --
+def linear_scorer(pipe) -> Callable[[pd.DataFrame], np.ndarray]:
+    """
+    Flatten a fitted preprocessor + LogisticRegression pipeline into NumPy arrays.
+
+    The StandardScaler is folded into the numeric weights, and each one-hot
+    block becomes a per-category weight lookup, so scoring is one GEMV plus
+    one gather per categorical column (no ColumnTransformer dispatch).
+
+    Args:
+        pipe (sklearn.pipeline.Pipeline): Steps "pre" (see
+            `make_preprocessor`) and "clf" (fitted LogisticRegression).
+
+    Returns:
+        Callable[[pd.DataFrame], np.ndarray]: Maps rows to class-1 probabilities.
+    """
+    pre, clf = pipe.named_steps["pre"], pipe.named_steps["clf"]
+    cols = {name: c for name, _, c in pre.transformers_}
+    scaler = pre.named_transformers_["num"]
+    ohe = pre.named_transformers_["cat"]
+    w = clf.coef_.ravel()
+
+    # (x - mean) / scale @ w  ==  x @ (w / scale) - mean @ (w / scale)
+    w_num = w[pre.output_indices_["num"]] / scaler.scale_
+    b = float(clf.intercept_[0]) - scaler.mean_ @ w_num
+
+    # One lookup per categorical column; the trailing 0 serves code -1
+    # (unseen category), matching handle_unknown="ignore"
+    w_cat = w[pre.output_indices_["cat"]]
+    bounds = np.cumsum([0] + [len(c) for c in ohe.categories_])
+    lookups = [np.append(w_cat[lo:hi], 0.0)
+               for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+    def score(df: pd.DataFrame) -> np.ndarray:
+        z = df[cols["num"]].to_numpy(dtype=float) @ w_num + b
+        for col, cats, lookup in zip(cols["cat"], ohe.categories_, lookups):
+            z += lookup[pd.Categorical(df[col], categories=cats).codes]
+        return expit(z)
+
+    return score
+
+
+def score_frame(pipe, df: pd.DataFrame) -> np.ndarray:
+    """
+    Predict fraud probabilities for a frame of dashboard-view rows.
+
+    Logistic regression pipelines (what `src.train` saves) go through
+    `linear_scorer`; anything else falls back to `predict_proba`.
+
+    Args:
+        pipe: Fitted pipeline exposing `predict_proba`.
+        df (pd.DataFrame): Rows from `vehicle.v_txn_for_dashboard`.
+
+    Returns:
+        np.ndarray: Probabilities of class 1, shape (n_samples,).
+    """
+    if isinstance(pipe.named_steps.get("clf"), LogisticRegression):
+        return linear_scorer(pipe)(df)
+    proba = pipe.predict_proba(df[NUM_COLS + CAT_COLS])
+    # handle both shapes just in case
+    return proba[:, 1] if getattr(proba, "ndim", 1) == 2 else proba
+
+
+def write_scores(scores: pd.DataFrame, engine: Engine) -> None:
+    """
+    Replace `vehicle.transaction_scores` with new scores in one transaction.
+
+    Args:
+        scores (pd.DataFrame): Columns `txn_id`, `proba`.
+        engine (Engine): SQLAlchemy engine (psycopg2 driver).
+    """
+    buf = io.StringIO()
+    scores.to_csv(buf, index=False, header=False)
+    buf.seek(0)
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE vehicle.transaction_scores"))
+        with conn.connection.cursor() as cur:
+            cur.copy_expert(
+                "COPY vehicle.transaction_scores (txn_id, proba) "
+                "FROM STDIN WITH (FORMAT CSV)", buf)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--model", default="models/logreg.pkl")
+    args = ap.parse_args()
+
+    engine = get_engine()
+    df = load_training_frame(engine)
+    pipe = joblib.load(args.model)
+
+    proba = score_frame(pipe, df)
+    write_scores(pd.DataFrame({"txn_id": df["txn_id"], "proba": proba}), engine)
+    print(f"Scored {len(df):,} transactions with {args.model}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,10 @@ Args:
     --test-size (float): Fraction of data for validation split (default: 0.25).
     --threshold (float): Probability cutoff for binary classification (default: 0.5).
     --seed (int): Random seed for reproducibility (default: 123).
-    --save (str): Path to save the trained pipeline as a .pkl file.
+    --solver (str): Optimizer passed to the model, e.g. 'lbfgs'/'saga' for logreg,
+        'lbfgs'/'gd' for logreg_scratch (default: the model's own).
+    --reg (float): L2 penalty for logreg_scratch (default: the model's own, 0).
+    --save (str): Path to save the trained pipeline as an LZ4-compressed joblib .pkl file.
 
 Outputs:
     - Console logs: fraud rates, ROC AUC, PR AUC, classification report.
@@ -21,16 +24,23 @@ Outputs:
 """
 # -- Imports --
 import argparse
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.pipeline import Pipeline
 import joblib
 
 from src.data.fetch import load_training_frame
-from src.features.build import add_basic_features, NUM_COLS, CAT_COLS, DROP_COLS
+from src.features.build import NUM_COLS, CAT_COLS
 from src.models.preprocess import make_preprocessor
 from src.eval.metrics import evaluate
 
 
+# --solver values each model accepts (checked before the data is loaded)
+SOLVERS = {
+    "logreg": ("lbfgs", "liblinear", "newton-cg", "newton-cholesky", "sag", "saga"),
+    "logreg_scratch": ("lbfgs", "gd"),
+}
+
+
 def import_model(name):
     match name:
         case "logreg":
@@ -53,27 +63,36 @@ def main():
     ap.add_argument("--test-size", type=float, default=0.25)
     ap.add_argument("--threshold", type=float, default=0.5)
     ap.add_argument("--seed", type=int, default=123)
+    ap.add_argument("--solver", type=str, default=None)
+    ap.add_argument("--reg", type=float, default=None)
     ap.add_argument("--save", type=str, default=None)
     args = ap.parse_args()
+    if args.reg is not None and args.model != "logreg_scratch":
+        ap.error("--reg is only supported by --model logreg_scratch")
+    if args.solver is not None and args.solver not in SOLVERS.get(args.model, (args.solver,)):
+        ap.error(f"--solver for --model {args.model} must be one of: "
+                 f"{', '.join(SOLVERS[args.model])}")
 
     # Load data
     df = load_training_frame()
     y = df["is_fraud"].astype(int).values
 
-    # Features
-    df = add_basic_features(df)
-    X = df.drop(columns=DROP_COLS)
+    # Features (log_amount, geo_delta, hour, dow come precomputed from the view);
+    # select only what the preprocessor reads instead of copying everything else
+    X = df.loc[:, NUM_COLS + CAT_COLS]
 
-    # Split
-    X_train, X_val, y_train, y_val = train_test_split(
-        X, y, test_size=args.test_size, random_state=args.seed, stratify=y
-    )
+    # Split: stratified row indices, then one positional take per side
+    sss = StratifiedShuffleSplit(n_splits=1, test_size=args.test_size, random_state=args.seed)
+    (tr_idx, va_idx), = sss.split(X, y)
+    X_train, X_val = X.iloc[tr_idx], X.iloc[va_idx]
+    y_train, y_val = y[tr_idx], y[va_idx]
     print(f"Fraud rate train/test: {y_train.mean():.3%} / {y_val.mean():.3%}")
 
     # Pipeline
     pre = make_preprocessor(NUM_COLS, CAT_COLS)
     Model = import_model(args.model)
-    model = Model(random_state=args.seed)
+    model_kwargs = {k: v for k, v in (("solver", args.solver), ("reg", args.reg)) if v is not None}
+    model = Model(random_state=args.seed, **model_kwargs)
     pipe = Pipeline([("pre", pre), ("clf", model)])
 
     # Train
@@ -110,7 +129,9 @@ def main():
                 ("clf", pipe.named_steps["clf"].clf),
             ])
 
-        joblib.dump(plain_pipe, args.save)
+        # LZ4 keeps dump/load fast; joblib.load detects the compression
+        # from the file itself, so the .pkl name still works
+        joblib.dump(plain_pipe, args.save, compress=("lz4", 3), protocol=5)
         print(f"Saved plain sklearn pipeline -> {args.save}")
 
 